@@ -1,11 +1,109 @@
+import concurrent.futures
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
 
 WIKIDOT_URI = "https://dnd5e.wikidot.com"
 
+CACHE_DIR = Path.home() / ".cache" / "dnd_search" / "http"
+CACHE_TTL = int(os.getenv("DND_CACHE_TTL", str(60 * 60 * 24 * 7)))
+USE_CACHE = True
+MAX_WORKERS = 8
+
+# Shared keep-alive session for every request. The pool holds one connection
+# per worker so api_call_many and get_spells_bulk threads never wait on it.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "dnd_search", "Accept-Encoding": "gzip, deflate"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS))
+
+_REMEMBER_LOCK = threading.Lock()
+
+
+def _cache_path(uri: str) -> Path:
+    return CACHE_DIR / f"{hashlib.md5(uri.encode('utf-8')).hexdigest()}.html"
+
+
+def _cache_get(uri: str) -> bytes | None:
+    """Returns the cached page for uri, or None if it is missing or expired"""
+    path = _cache_path(uri)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            logging.debug(f"Cache expired for {uri}")
+            return None
+        logging.debug(f"Cache hit for {uri}")
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _cache_set(uri: str, content: bytes) -> None:
+    """Writes the page content for uri to the on-disk cache"""
+    tmp = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A temporary file per write, so concurrent writers never share one
+        with tempfile.NamedTemporaryFile(
+            dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(content)
+        Path(tmp.name).replace(_cache_path(uri))
+    except OSError as e:
+        logging.warning(f"Failed to write cache: {e}")
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+
 
-def api_call(uri: str) -> dict:
+def _fetch(uri: str) -> bytes:
+    """Requests uri over the shared session and stores the response in the cache"""
+    req = SESSION.get(uri, timeout=10)
+
+    if req.status_code != 200:
+        raise requests.HTTPError(f"{req.status_code} returned for {uri}", response=req)
+
+    if USE_CACHE:
+        _cache_set(uri, req.content)
+
+    return req.content
+
+
+def remember(cache: dict, key, value, maxsize: int):
     """
-    Returns html content for URI request
+    Stores a parsed lookup result in one of the in-process caches. Once the
+    cache holds maxsize entries the oldest one is dropped. None is never
+    stored, so a failed lookup is retried on the next call.
+
+    Args:
+        cache: Dictionary the result is kept in
+        key: Arguments the result was looked up with
+        value: The result to store
+        maxsize: Largest number of entries the cache may hold
+
+    Returns:
+        value, unchanged
+    """
+    if value is None:
+        return None
+
+    with _REMEMBER_LOCK:
+        if key not in cache and len(cache) >= maxsize:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    return value
+
+
+def api_call(uri: str) -> bytes:
+    """
+    Returns html content for URI request. Responses are cached on disk
+    for CACHE_TTL seconds unless USE_CACHE is disabled.
+
     Args:
         uri: Address to query against
 
@@ -13,10 +111,43 @@ def api_call(uri: str) -> dict:
         HTML content of requested web page
 
     Raises:
-        AssertionError: raised if a 200 status code is not returned
+        requests.HTTPError: raised if a 200 status code is not returned
+        requests.RequestException: raised if the request could not be made
     """
-    req = requests.get(uri)
+    if USE_CACHE and (content := _cache_get(uri)) is not None:
+        return content
 
-    assert req.status_code == 200
+    return _fetch(uri)
 
-    return req.content
+
+def api_call_many(uris: list[str]) -> dict[str, bytes]:
+    """
+    Fetches several pages concurrently over the shared session. Pages
+    already in the on-disk cache are read directly and only the misses
+    are sent to the thread pool.
+
+    Args:
+        uris: Addresses to query against
+
+    Returns:
+        A dictionary mapping each URI to the HTML content of its page
+
+    Raises:
+        requests.HTTPError: raised if any page does not return a 200 status code
+        requests.RequestException: raised if any of the requests could not be made
+    """
+    pages = {}
+    if USE_CACHE:
+        for uri in uris:
+            if (content := _cache_get(uri)) is not None:
+                pages[uri] = content
+
+    missing = [uri for uri in dict.fromkeys(uris) if uri not in pages]
+    if len(missing) == 1:
+        pages[missing[0]] = _fetch(missing[0])
+    elif missing:
+        workers = min(MAX_WORKERS, len(missing))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pages.update(zip(missing, executor.map(_fetch, missing)))
+
+    return {uri: pages[uri] for uri in uris}
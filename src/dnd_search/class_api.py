@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
 
 import logging
-import re
+from collections.abc import Iterable
 
-from bs4 import BeautifulSoup, NavigableString
+import requests
+from bs4 import BeautifulSoup, NavigableString, Tag
 
 import dnd_search.api as api
 from dnd_search.dnd_data import Feature, Subclass, DnDClass
 from dnd_search.format_output import format_error
 
+_SLUG_TABLE = str.maketrans(" ", "-")
+_HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+# Parsed pages shared with every caller, which must not mutate them
+_CLASSES: dict[str, DnDClass] = {}
+_SUBCLASSES: dict[tuple[str, str], Subclass] = {}
+
+
+def _is_section(tag: Tag) -> bool:
+    """Matches the direct children of #page-content that hold page content"""
+    return tag.name != "br"
+
 
 def table_to_list(input_str: NavigableString) -> list:
     """
@@ -23,19 +36,23 @@ def table_to_list(input_str: NavigableString) -> list:
     if input_str is None:
         return None
 
-    table = [
-        [col.text for col in row.find_all(["th", "td"])]
-        for row in input_str.find_all("tr")
-    ]
-    row_length = max([len(row) for row in table])
+    table = []
+    row_length = 0
+    for row in input_str.find_all("tr"):
+        cells = [col.text for col in row.find_all(["th", "td"])]
+        row_length = max(row_length, len(cells))
+        table.append(cells)
 
     return [row for row in table if len(row) == row_length]
 
 
-def separate_section(sections: list) -> list[list]:
+def separate_section(sections: Iterable) -> list[list]:
     """
-    Takes a list of Tags/NavigableStrings and then splits the list whenever a header element is encountered.
-    I.e. any html element starting with h[1-5] splits the sections
+    Takes an iterable of Tags/NavigableStrings and then splits it whenever a header element is encountered.
+    I.e. any h1-h6 element splits the sections
+
+    The sections are grouped in a single pass, so a generator such as the
+    result of find_all can be passed in directly.
 
     Args:
         section: A section containing relevant tags that need to be sorted
@@ -44,12 +61,13 @@ def separate_section(sections: list) -> list[list]:
         A 2D list containing the separated sections
     """
     features = []
-    previous_index = 0
+    current = []
 
-    for index, section in enumerate(sections):
-        if "h" in section.name and len(sections[previous_index:index]) > 0:
-            features.append(sections[previous_index:index])
-            previous_index = index
+    for section in sections:
+        if section.name in _HEADER_TAGS and current:
+            features.append(current)
+            current = []
+        current.append(section)
 
     return features
 
@@ -76,24 +94,25 @@ def group_features_by_header(
 
     for feature in feature_list:
         feature_title, feature_table = [None] * 2
-        feature_desc = ""
+        feature_desc = []
 
         for tag in feature:
-            if "h" in tag.name:
+            if tag.name in _HEADER_TAGS:
                 feature_title = tag.text
 
             elif tag.name == "p":
-                feature_desc = f"{feature_desc}{tag.text}\n\n"
+                feature_desc.extend((tag.text, "\n\n"))
 
-            elif "ul" in tag.name:
-                for t in [t for t in tag if t != "\n"]:
-                    feature_desc = f"{feature_desc.strip()}\n\t• {t.text.strip()}"
-                feature_desc = f"{feature_desc}\n\n"
+            elif tag.name == "ul":
+                # Bullets follow directly after the preceding paragraph
+                feature_desc = ["".join(feature_desc).strip()]
+                feature_desc.extend(f"\n\t• {t.text.strip()}" for t in tag if t != "\n")
+                feature_desc.append("\n\n")
 
-            elif "table" in tag.name:
+            elif tag.name == "table":
                 feature_table = table_to_list(tag)
 
-        f = Feature(feature_title, feature_desc, feature_table)
+        f = Feature(feature_title, "".join(feature_desc), feature_table)
         features.append(f)
     return features
 
@@ -112,48 +131,48 @@ def get_class(class_name: str) -> DnDClass:
     Returns:
         An object containing the class' description, multiclass requirements, leveling table, and features
     """
+    if (dnd_class := _CLASSES.get(class_name)) is not None:
+        return dnd_class
+
     uri = f"{api.WIKIDOT_URI}/{class_name.lower()}"
     try:
         content = api.api_call(uri)
-    except AssertionError:
+    except requests.HTTPError:
         output = format_error("class", class_name.title())
         logging.error(output)
         return None
+    except requests.RequestException as e:
+        logging.error(f"Unable to reach {uri}: {e}")
+        return None
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = BeautifulSoup(content, "lxml")
     name = soup.find(class_="page-title").text
-    sections = [
-        section
-        for section in soup.find(id="page-content")
-        if section is not None and section != "\n" and section.name != "br"
-    ]
+    sections = soup.select_one("#page-content").find_all(_is_section, recursive=False)
 
     for index in range(0, len(sections[:3])):
         if "multiclass" in sections[index].text:
             break
 
-    description = " ".join([tag.text for tag in sections[:index]])
+    description = " ".join(tag.text for tag in sections[:index])
     multiclass = sections[index].text
     leveling_table = sections[index + 1]
-    features = sections[index + 2 :]
+    features_root = sections[index + 2]
     leveling_headers, *leveling_table = table_to_list(leveling_table)
-    class_components = DnDClass(
-        name, description, multiclass, leveling_headers, leveling_table, None
-    )
 
-    features = list(
-        next(feature for feature in features if feature != "\n").find_all(
-            ["h1", "h3", "h5", "p", "ul", "table"]
-        )
-    )
-
-    class_features = separate_section(features)
-    class_components.features = group_features_by_header(
-        class_features, skip_first=True
+    class_features = separate_section(
+        features_root.find_all(["h1", "h3", "h5", "p", "ul", "table"])
     )
+    features = group_features_by_header(class_features, skip_first=True)
     logging.debug(f"Created object for class {class_name}")
 
-    return class_components
+    return api.remember(
+        _CLASSES,
+        class_name,
+        DnDClass(
+            name, description, multiclass, leveling_headers, leveling_table, features
+        ),
+        maxsize=64,
+    )
 
 
 def get_subclass(class_name: str, subclass: str) -> DnDClass:
@@ -167,30 +186,45 @@ def get_subclass(class_name: str, subclass: str) -> DnDClass:
     Returns:
         An object containing the subclass' description and features
     """
-    uri = f"{api.WIKIDOT_URI}/{class_name.lower()}:{subclass.replace(' ', '-').lower()}"
+    if (subclass_data := _SUBCLASSES.get((class_name, subclass))) is not None:
+        return subclass_data
+
+    slug = subclass.translate(_SLUG_TABLE).lower()
+    uri = f"{api.WIKIDOT_URI}/{class_name.lower()}:{slug}"
     try:
         content = api.api_call(uri)
-    except AssertionError:
+    except requests.HTTPError:
         output = format_error("subclass", f"{class_name.title()}|{subclass.title()}")
         logging.error(output)
         return None
+    except requests.RequestException as e:
+        logging.error(f"Unable to reach {uri}: {e}")
+        return None
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = BeautifulSoup(content, "lxml")
     name = soup.find(class_="page-title").text
-    name = re.sub(f"^{class_name.title()}.*:", "", name).strip()
+    if name.lower().startswith(class_name.lower()):
+        name = name.split(":", 1)[-1]
+    name = name.strip()
 
-    *description, features = [
-        section
-        for section in soup.find(id="page-content")
-        if section is not None and section != "\n"
-    ]
+    *description, features = soup.select_one("#page-content").find_all(
+        _is_section, recursive=False
+    )
     if isinstance(description, list):
-        description = " ".join([tag.text for tag in description])
+        description = " ".join(tag.text for tag in description)
     else:
         description = description.text
     subclass_features = separate_section(features.find_all(["p", "h3"]))
     source, *features = group_features_by_header(subclass_features)
-    source = re.sub("^Source.*:", "", source.description).strip()
+    source = source.description
+    if source.startswith("Source") and ":" in source:
+        source = source.split(":", 1)[1]
+    source = source.strip()
     logging.debug(f"Created object for subclass {class_name}:{name}")
 
-    return Subclass(class_name.title(), name, description, source, features)
+    return api.remember(
+        _SUBCLASSES,
+        (class_name, subclass),
+        Subclass(class_name.title(), name, description, source, features),
+        maxsize=64,
+    )
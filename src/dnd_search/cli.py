@@ -6,25 +6,13 @@ import logging
 import sys
 from signal import signal, SIGPIPE, SIG_DFL
 
+import dnd_search.api as api
 import dnd_search.class_api as class_api
 import dnd_search.format_output as format_output
 import dnd_search.spell_api as spell_api
-from dnd_search.dnd_data import Subclass, DnDClass
-
-DND_CLASSES = [
-    "artificer",
-    "barbarian",
-    "bard",
-    "cleric",
-    "druid",
-    "fighter",
-    "monk",
-    "paladin",
-    "rogue",
-    "sorcerer",
-    "warlock",
-    "wizard",
-]
+from dnd_search.dnd_data import DND_CLASSES, Subclass, DnDClass
+
+_PARSER_CACHE = {}
 
 
 def spell_subcommand(subparsers: argparse.ArgumentParser) -> tuple:
@@ -234,12 +222,17 @@ def class_output(
 
     output = None
     if feature_flag:
-        search_string = " ".join(feature_flag)
-        features = [
-            format_output.format_feature(feature, output_format)
-            for feature in class_data.features
-            if search_string.lower() in feature.title.lower()
-        ]
+        search_string = " ".join(feature_flag).lower()
+        titles = [feature.title.lower() for feature in class_data.features]
+
+        # A single scan over all titles rules out searches with no matches
+        features = []
+        if search_string in "\n".join(titles):
+            features = [
+                format_output.format_feature(feature, output_format)
+                for feature, title in zip(class_data.features, titles)
+                if search_string in title
+            ]
 
         if output_format == "json":
             features = json.loads('{"features": ' + f"[{','.join(features)}]" + "}")
@@ -257,6 +250,51 @@ def class_output(
     return output
 
 
+def build_parser(command: str | None = None) -> tuple:
+    """
+    Builds the argument parser for the given subcommand.
+
+    Only the subparsers for command are added, so invoking a single subcommand
+    skips constructing the other one. Any other command builds the full parser
+    (e.g. for --help). Parsers are cached per command.
+
+    Args:
+        command: The subcommand that will be run. Ex: spell
+
+    Returns:
+        The main parser followed by the spell and class parser tuples. The tuple
+        for a subcommand that was not built contains None for each parser.
+    """
+    if command not in ("spell", "class"):
+        command = None
+
+    if command in _PARSER_CACHE:
+        return _PARSER_CACHE[command]
+
+    parser = argparse.ArgumentParser(
+        prog="dnd_search",
+        description="This is meant to be a quick way to \
+                search up either a spell or spell list \
+                for a given DnD 5e class. It uses \
+                https://dnd5e.wikidot.com to scrape information",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk cache and fetch fresh pages from wikidot",
+    )
+    subparsers = parser.add_subparsers(help="command help", dest="subparser_name")
+
+    spell_parsers = class_parsers = (None, None, None)
+    if command in (None, "spell"):
+        spell_parsers = spell_subcommand(subparsers)
+    if command in (None, "class"):
+        class_parsers = class_subcommand(subparsers)
+
+    _PARSER_CACHE[command] = (parser, spell_parsers, class_parsers)
+    return _PARSER_CACHE[command]
+
+
 def cli() -> None:
     """Contains all logic regarding use as a command line interface."""
     stream_handler = logging.StreamHandler()
@@ -270,28 +308,23 @@ def cli() -> None:
         handlers=[stream_handler, file_handler],
     )
 
-    parser = argparse.ArgumentParser(
-        prog="dnd_search",
-        description="This is meant to be a quick way to \
-                search up either a spell or spell list \
-                for a given DnD 5e class. It uses \
-                https://dnd5e.wikidot.com to scrape information",
-    )
-    subparsers = parser.add_subparsers(help="command help", dest="subparser_name")
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    parser, spell_parsers, class_parsers = build_parser(command)
 
     # For SPELL subcommands
-    spell_parser, spell_get_parser, spell_list_parser = spell_subcommand(subparsers)
+    spell_parser, spell_get_parser, spell_list_parser = spell_parsers
 
     # For CLASS subcommmand
-    class_parser, class_base_parser, class_sub_parser = class_subcommand(subparsers)
+    class_parser, class_base_parser, class_sub_parser = class_parsers
 
     args = parser.parse_args()
+    api.USE_CACHE = not args.no_cache
 
-    if len(sys.argv) <= 2:
-        parser.parse_args(["--help"])
+    output = None
+    if args.subparser_name is None or getattr(args, "subcommand", None) is None:
+        build_parser()[0].parse_args(["--help"])
 
     elif args.subparser_name == "spell":
-        output = None
         if args.subcommand == "get":
             spell_name = " ".join(args.spell_name)
 
@@ -309,6 +342,10 @@ def cli() -> None:
             logging.debug(f"Fetching spell list for {class_name}")
             spell_list = spell_api.get_spell_list(class_name, args.short)
             usage_and_error(spell_list, spell_list_parser)
+            if args.output in {"csv", "tsv"}:
+                # Stream delimited rows rather than building the whole table
+                format_output.write_spell_list(spell_list, sys.stdout, args)
+                return
             output = format_output.format_spell_list(spell_list, args)
 
     elif args.subparser_name == "class":
@@ -348,7 +385,7 @@ def cli() -> None:
                 )
 
     else:
-        parser.parse_args(["--help"])
+        build_parser()[0].parse_args(["--help"])
 
     print(output)
 
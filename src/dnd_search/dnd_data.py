@@ -1,21 +1,47 @@
 #!/usr/bin/env python3
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from typing import Final
+
+DND_CLASSES: Final[tuple[str, ...]] = (
+    "artificer",
+    "barbarian",
+    "bard",
+    "cleric",
+    "druid",
+    "fighter",
+    "monk",
+    "paladin",
+    "rogue",
+    "sorcerer",
+    "warlock",
+    "wizard",
+)
+
+
+class _Serializable:
+    """Shared dict() conversion for the dataclasses below"""
+
+    __slots__ = ()
+
+    def dict(self):
+        return {
+            k: str(v)
+            for k in self.__dataclass_fields__
+            if (v := getattr(self, k)) is not None and v != ""
+        }
 
 
-@dataclass
-class Feature:
+@dataclass(slots=True, frozen=True)
+class Feature(_Serializable):
     """Class Feature for either a DndClass or Subclass"""
 
     title: str
     description: str
     table: list[list]
 
-    def dict(self):
-        return {k: str(v) for k, v in asdict(self).items() if v is not None and v != ""}
 
-
-@dataclass
-class Subclass:
+@dataclass(slots=True, frozen=True)
+class Subclass(_Serializable):
     """Subclass/Archetype data for a DnDClass"""
 
     class_name: str
@@ -24,12 +50,9 @@ class Subclass:
     source: str
     features: list[Feature]
 
-    def dict(self):
-        return {k: str(v) for k, v in asdict(self).items() if v is not None and v != ""}
-
 
-@dataclass
-class DnDClass:
+@dataclass(slots=True, frozen=True)
+class DnDClass(_Serializable):
     """Class data for a DnD 5e Player Class"""
 
     class_name: str
@@ -39,12 +62,9 @@ class DnDClass:
     leveling_table: list[list]
     features: list[Feature]
 
-    def dict(self):
-        return {k: str(v) for k, v in asdict(self).items() if v is not None and v != ""}
-
 
-@dataclass
-class Spell:
+@dataclass(slots=True, frozen=True)
+class Spell(_Serializable):
     """DnD 5e Spell data"""
 
     name: str
@@ -58,6 +78,3 @@ class Spell:
     effect: str
     higher_level_effect: str
     classes: list[str]
-
-    def dict(self):
-        return {k: str(v) for k, v in asdict(self).items() if v is not None and v != ""}
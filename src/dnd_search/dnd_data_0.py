@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import dataclasses
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -22,10 +22,17 @@ class Base:
         """
         Converts class data into a dictionary format
         """
-        return {k: str(v) for k, v in asdict(self).items() if v is not None and v != ""}
+        return {
+            k: str(v)
+            for k in self.__dataclass_fields__
+            if (v := getattr(self, k)) is not None and v != ""
+        }
 
-    def to_json(self):
-        json.dumps(self.dict())
+    def to_json(self) -> str:
+        """
+        Converts class data into a JSON string
+        """
+        return json.dumps(self.dict())
 
 
 @dataclass
@@ -111,7 +118,8 @@ class SubClass(BaseClass):
     source: str
 
 
-f = Feature(name="Test", description="Test", table=[[0, 1]])
-c = BaseClass(name="barbarian", description="Test", features=[f])
-print(dataclasses.fields(f))
-print(c.name, c.description, c.features)
+if __name__ == "__main__":
+    f = Feature(name="Test", description="Test", table=[[0, 1]])
+    c = BaseClass(name="barbarian", description="Test", features=[f])
+    print(dataclasses.fields(f))
+    print(c.name, c.description, c.features)
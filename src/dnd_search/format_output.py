@@ -1,14 +1,60 @@
 #!/usr/bin/env python3
 
+import csv
+import io
 import json
 import re
 import textwrap
 import tabulate
 from argparse import Namespace
+from functools import lru_cache, partial
+from operator import attrgetter
 from shutil import get_terminal_size
+from typing import TextIO
 
 from dnd_search.dnd_data import Spell, Feature, DnDClass, Subclass
 
+_CSV_DELETE = str.maketrans("", "", ",\n")
+_TSV_DELETE = str.maketrans("", "", "\t\n")
+
+# Columns of a spell csv/tsv row. Only the free text fields need their
+# delimiters stripped.
+_SPELL_ROW_FIELDS = attrgetter(
+    "name", "source", "level", "school", "casting_time", "spell_range", "duration"
+)
+_SPELL_ROW_TEXT = attrgetter("components", "effect", "higher_level_effect")
+
+_HR40 = "─" * 40
+
+_SPELL_LIST_HEADERS = (
+    "Name",
+    "Level",
+    "School",
+    "Casting Time",
+    "Range",
+    "Duration",
+    "Components",
+)
+_LEVEL_IDX, _SCHOOL_IDX, _COMPONENT_IDX = 1, 2, 6
+
+# Phrases in feature descriptions that are bolded in txt output, combined
+# into one alternation so the description is only scanned once
+_HIGHLIGHT_LITERALS = (
+    "Spell save DC",
+    "Spell attack modifier",
+    "Copying a Spell into the Book.",
+    "Replacing the Book.",
+    "The Book's Appearance.",
+)
+_HIGHLIGHT_RE = re.compile(
+    "|".join(
+        [
+            "(Hit|Armor|Weapons|Tools|Saving|Skills)(.*):",
+            *map(re.escape, _HIGHLIGHT_LITERALS),
+        ]
+    )
+)
+
 
 class colors:
     """
@@ -34,6 +80,13 @@ class colors:
     BLUE = f"{_start}94m"
 
 
+@lru_cache(maxsize=1)
+def _terminal_rule() -> tuple[int, str]:
+    """Returns the terminal width and a horizontal rule spanning it"""
+    width, _ = get_terminal_size()
+    return width, "─" * width
+
+
 def format_json(json_obj: dict) -> str:
     """
     Prints the data in a json format. Wrapper around json.dumps function
@@ -56,51 +109,139 @@ def format_table(
     Args:
         table: A 2D list containing all the table data
         headers: Table headers
+        output_format: Either csv or tsv for delimited output, otherwise a text table
 
     Returns:
         String containing the formatted table
     """
     formatted_table = None
 
-    if "sv" in output_format:
-        table = [headers] + table
-        chars = (",", "\t")
-
-        if output_format == "csv":
-            joining_char, replace_char = chars
-        else:
-            replace_char, joining_char = chars
-
-        replace_pattern = f"[{joining_char}\n]"
-        print(
-            [
-                [re.sub(replace_pattern, replace_char, col) for col in row]
-                for row in table
-            ]
-        )
-
-        formatted_table = "\n".join(
-            [
-                joining_char.join(
-                    [re.sub(joining_char, replace_pattern, str(col)) for col in row]
-                )
-                for row in table
-            ]
-        )
+    if output_format in ("csv", "tsv"):
+        buffer = io.StringIO()
+        write_table(table, headers, buffer, output_format)
+        formatted_table = buffer.getvalue().rstrip("\n")
     else:
         formatted_table = tabulate.tabulate(table, headers=headers, tablefmt="simple")
 
     return formatted_table
 
 
+def write_table(
+    table: list[list], headers: list[str], out_stream: TextIO, output_format: str
+) -> None:
+    """
+    Streams the data as delimited rows to out_stream.
+
+    Args:
+        table: A 2D list containing all the table data
+        headers: Table headers
+        out_stream: Text stream the rows are written to
+        output_format: Either csv or tsv
+    """
+    joining_char = "," if output_format == "csv" else "\t"
+
+    writer = csv.writer(out_stream, delimiter=joining_char, lineterminator="\n")
+    writer.writerow(headers)
+    writer.writerows(table)
+
+
 def format_error(subcommand: str, name: str) -> str:
     """Error message"""
-    return textwrap.dedent(
+    return (
         f"Unable to find data for the {subcommand} '{name.replace(':', '')}'. "
         f"Please ensure that the {subcommand} is spelled correctly."
     )
 
 
+def _format_spell_delimited(spell: Spell, joining_char: str, delete_table: dict) -> str:
+    """Formats a spell as a single csv/tsv row"""
+    quoted_sep = f'"{joining_char}"'
+    return (
+        '"'
+        + quoted_sep.join(
+            [
+                *_SPELL_ROW_FIELDS(spell),
+                *[text.translate(delete_table) for text in _SPELL_ROW_TEXT(spell)],
+                ",".join(spell.classes),
+            ]
+        )
+        + '"'
+    )
+
+
+def _format_spell_json(spell: Spell) -> str:
+    """Formats a spell as a JSON object"""
+    return format_json(spell.dict())
+
+
+def _format_spell_md(spell: Spell) -> str:
+    """Formats a spell as markdown"""
+    hle = (
+        f"\nAt Higher Levels. {spell.higher_level_effect}\n"
+        if spell.higher_level_effect
+        else ""
+    )
+    return (
+        textwrap.dedent(
+            f"""\
+        {spell.name}
+        -
+        Source:       {spell.source}\\
+        Level:        {spell.level.capitalize()}\\
+        School:       {spell.school.capitalize()}\\
+        Casting Time: {spell.casting_time}\\
+        Range:        {spell.spell_range}\\
+        Components:   {spell.components}\\
+        Duration:     {spell.duration}\\
+        Effect:"""
+        )
+        + f"\n{'\n'.join([sentence.strip() for sentence in spell.effect.split('.')])}"
+        + hle
+        + f"Spell Lists: {', '.join(spell.classes)}\n"
+    )
+
+
+def _format_spell_txt(spell: Spell) -> str:
+    """Formats a spell for the terminal, emulating the player handbook"""
+    TERM_WIDTH, TERM_RULE = _terminal_rule()
+    padding = int((TERM_WIDTH - len(spell.name)) / 2)
+    hle = (
+        f"{colors.BOLD}At Higher Levels.{colors.CLEAR} {spell.higher_level_effect}\n"
+        if spell.higher_level_effect
+        else ""
+    )
+    return (
+        textwrap.dedent(
+            f"""\
+        {TERM_RULE}
+        {" " * padding}{colors.BOLD}{spell.name}{colors.CLEAR}
+        {TERM_RULE}
+        {colors.BOLD}Source:{colors.CLEAR}       {spell.source}
+        {colors.BOLD}Level:{colors.CLEAR}        {spell.level.capitalize()}
+        {colors.BOLD}School:{colors.CLEAR}       {spell.school.capitalize()}
+        {colors.BOLD}Casting Time:{colors.CLEAR} {spell.casting_time}
+        {colors.BOLD}Range:{colors.CLEAR}        {spell.spell_range}
+        {colors.BOLD}Components:{colors.CLEAR}   {spell.components}
+        {colors.BOLD}Duration:{colors.CLEAR}     {spell.duration}
+        """
+        )
+        + f"\n{spell.effect.replace('*', '•')}"
+        + hle
+        + f"{colors.BOLD}Spell Lists:{colors.CLEAR} {', '.join(spell.classes)}\n"
+    )
+
+
+_SPELL_FORMATTERS = {
+    "csv": partial(_format_spell_delimited, joining_char=",", delete_table=_CSV_DELETE),
+    "tsv": partial(
+        _format_spell_delimited, joining_char="\t", delete_table=_TSV_DELETE
+    ),
+    "json": _format_spell_json,
+    "md": _format_spell_md,
+    "txt": _format_spell_txt,
+}
+
+
 def format_spell(spell: Spell, output_format: str = "txt") -> None:
     """
     Formats the Spell class into the specified format.
@@ -114,100 +255,7 @@ def format_spell(spell: Spell, output_format: str = "txt") -> None:
     if spell is None:
         return None
 
-    if output_format == "csv" or output_format == "tsv":
-        chars = (",", "\t")
-
-        if output_format == "csv":
-            joining_char, replace_char = chars
-            replace_char = ","
-        else:
-            replace_char, joining_char = chars
-
-        replace_pattern = f"[{joining_char}\n]"
-        formatted_spell = joining_char.join(
-            [
-                f'"{col}"'
-                for col in (
-                    spell.name,
-                    spell.source,
-                    spell.level,
-                    spell.school,
-                    spell.casting_time,
-                    spell.spell_range,
-                    spell.duration,
-                    re.sub(replace_pattern, "", spell.components),
-                    re.sub(replace_pattern, "", spell.effect),
-                    re.sub(replace_pattern, "", spell.higher_level_effect),
-                    replace_char.join(spell.classes),
-                )
-            ]
-        )
-
-    elif output_format == "json":
-        formatted_spell = format_json(spell.dict())
-
-    elif output_format == "md":
-        hle = (
-            f"\nAt Higher Levels. {spell.higher_level_effect}\n"
-            if spell.higher_level_effect
-            else ""
-        )
-        formatted_spell = (
-            textwrap.dedent(
-                f"""\
-            {spell.name}
-            -
-            Source:       {spell.source}\\
-            Level:        {spell.level.capitalize()}\\
-            School:       {spell.school.capitalize()}\\
-            Casting Time: {spell.casting_time}\\
-            Range:        {spell.spell_range}\\
-            Components:   {spell.components}\\
-            Duration:     {spell.duration}\\
-            Effect:"""
-            )
-            + f"\n{'\n'.join([sentence.strip() for sentence in spell.effect.split('.')])}"
-            + hle
-            + textwrap.dedent(
-                f"""\
-            Spell Lists: {", ".join(spell.classes)}
-            """
-            )
-        )
-
-    else:
-        TERM_WIDTH, _ = get_terminal_size()
-        padding = int((TERM_WIDTH - len(spell.name)) / 2)
-        hle = (
-            f"{colors.BOLD}At Higher Levels.{colors.CLEAR} {spell.higher_level_effect}\n"
-            if spell.higher_level_effect
-            else ""
-        )
-        formatted_spell = (
-            textwrap.dedent(
-                f"""\
-            {"─" * TERM_WIDTH}
-            {" " * padding}{colors.BOLD}{spell.name}{colors.CLEAR}
-            {"─" * TERM_WIDTH}
-            {colors.BOLD}Source:{colors.CLEAR}       {spell.source}
-            {colors.BOLD}Level:{colors.CLEAR}        {spell.level.capitalize()}
-            {colors.BOLD}School:{colors.CLEAR}       {spell.school.capitalize()}
-            {colors.BOLD}Casting Time:{colors.CLEAR} {spell.casting_time}
-            {colors.BOLD}Range:{colors.CLEAR}        {spell.spell_range}
-            {colors.BOLD}Components:{colors.CLEAR}   {spell.components}
-            {colors.BOLD}Duration:{colors.CLEAR}     {spell.duration}
-            """
-            )
-            + f"\n{spell.effect.replace('*', '\u2022')}"
-            + hle
-            + textwrap.dedent(
-                f"""\
-            {colors.BOLD}Spell Lists:{colors.CLEAR} {", ".join(spell.classes)}
-            """
-            )
-        )
-
-    return formatted_spell
+    return _SPELL_FORMATTERS.get(output_format, _format_spell_txt)(spell)
 
 
 def limit_search(
@@ -230,120 +278,208 @@ def limit_search(
     Returns:
         list: A limited list containing the selected result set
     """
+    if isinstance(condition, (str, int)):
+        condition = [condition]
+    tokens = [str(c).lower() for c in condition]
+
+    if len(tokens) == 1:
+        # Most searches use one term, skip building an all() generator per row
+        (token,) = tokens
+
+        def matches(row) -> bool:
+            return token in str(row[column_index]).lower()
+
+    else:
+
+        def matches(row) -> bool:
+            column = str(row[column_index]).lower()
+            return all(token in column for token in tokens)
+
     if shorten:
         header.pop(column_index)
-        data = [
-            d[:column_index] + d[column_index + 1 :]
-            for d in data
-            if str(d[column_index]).lower() == str(condition).lower()
-            or str(condition).lower() in str(d[column_index]).lower()
-        ]
+        data = [d[:column_index] + d[column_index + 1 :] for d in data if matches(d)]
     else:
-        data = [
-            d
-            for d in data
-            if str(d[column_index]).lower() == str(condition).lower()
-            or str(condition).lower() in str(d[column_index]).lower()
-            or all(str(c).lower() in str(d[column_index]).lower() for c in condition)
-        ]
+        data = [d for d in data if matches(d)]
 
     return data
 
 
-def format_spell_list(spell_list: list[Spell], cli_arguments: Namespace = None) -> str:
+def write_spell_list(
+    spell_list: list[Spell], out_stream: TextIO, cli_arguments: Namespace
+) -> None:
     """
-    Formats a list of spells into different formats. Options: csv, tsv, json, and txt. Default: text
+    Writes a list of spells to out_stream in the format given on the command
+    line. Options: csv, tsv, json, and txt. Default: text
+
+    Delimited output is streamed row by row instead of being built up as one
+    string first.
 
     Args:
         spell_list: List containing abbreviated spell information
+        out_stream: Text stream the spell list is written to
         cli_arguments: A namedtuple containing command line arguments
-
-    Returns:
-        String containing the spell list in the desired output format
     """
-    headers = [
-        "Name",
-        "Level",
-        "School",
-        "Casting Time",
-        "Range",
-        "Duration",
-        "Components",
+    if cli_arguments.short:
+        # limit_search drops filtered columns from the header in place
+        headers = list(_SPELL_LIST_HEADERS)
+    else:
+        headers = _SPELL_LIST_HEADERS
+
+    spell_list = [
+        [
+            spell.name,
+            spell.level,
+            spell.school,
+            spell.casting_time,
+            spell.spell_range,
+            spell.duration,
+            spell.components,
+        ]
+        for spell in spell_list
     ]
 
-    if cli_arguments is None:
-        return spell_list
-
-    # Limit search result set
-    if cli_arguments.level:
+    # Limit search result set. Filter columns are in ascending order, so each
+    # column dropped by a shortened search shifts the following ones left.
+    removed = 0
+    for condition, column_index in (
+        (cli_arguments.level, _LEVEL_IDX),
+        (cli_arguments.school, _SCHOOL_IDX),
+        (cli_arguments.component, _COMPONENT_IDX),
+    ):
+        if not condition:
+            continue
         spell_list = limit_search(
             headers,
             spell_list,
-            cli_arguments.level,
-            headers.index("Level"),
-            cli_arguments.short,
-        )
-
-    if cli_arguments.school:
-        spell_list = limit_search(
-            headers,
-            spell_list,
-            cli_arguments.school,
-            headers.index("School"),
-            cli_arguments.short,
-        )
-
-    if cli_arguments.component:
-        spell_list = limit_search(
-            headers,
-            spell_list,
-            cli_arguments.component,
-            headers.index("Components"),
+            condition,
+            column_index - removed,
             cli_arguments.short,
         )
+        if cli_arguments.short:
+            removed += 1
 
     # Output format
-    if "sv" in cli_arguments.output:
-        joining_char = "," if cli_arguments.output == "csv" else "\t"
-
-        formatted_list = "\n".join(
-            [
-                joining_char.join(
-                    [
-                        str(val).replace(joining_char, "")
-                        for val in spell.dict().values()
-                    ]
-                )
-                for spell in spell_list
-            ]
-        )
+    if cli_arguments.output in {"csv", "tsv"}:
+        write_table(spell_list, headers, out_stream, cli_arguments.output)
 
     elif cli_arguments.output == "json":
-        formatted_list = format_json(
-            {
-                "Spell Count": len(spell_list),
-                "Spells": [dict(zip(headers, spell)) for spell in spell_list],
-            }
+        out_stream.write(
+            format_json(
+                {
+                    "Spell Count": len(spell_list),
+                    "Spells": [dict(zip(headers, spell)) for spell in spell_list],
+                }
+            )
         )
 
     else:
-        formatted_list = format_table(spell_list, headers=headers)
+        out_stream.write(format_table(spell_list, headers=headers))
 
-    return formatted_list
 
+def format_spell_list(spell_list: list[Spell], cli_arguments: Namespace = None) -> str:
+    """
+    Formats a list of spells into different formats. Options: csv, tsv, json, and txt. Default: text
+
+    Args:
+        spell_list: List containing abbreviated spell information
+        cli_arguments: A namedtuple containing command line arguments
 
-def colorize(text, pattern) -> str:
+    Returns:
+        String containing the spell list in the desired output format
+    """
+    if cli_arguments is None:
+        return spell_list
+
+    buffer = io.StringIO()
+    write_spell_list(spell_list, buffer, cli_arguments)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _bold_match(match: re.Match) -> str:
+    return f"{colors.BOLD}{match.group()}{colors.CLEAR}"
+
+
+@lru_cache(maxsize=512)
+def _bold_title(title: str) -> str:
+    """Returns the bolded feature title followed by a horizontal rule"""
+    return f"{colors.BOLD}{title}{colors.CLEAR}\n{_HR40}"
+
+
+def colorize(text, pattern: re.Pattern) -> str:
     """
     Function to go through and add ANSI escape codes to the desired text.
 
     Args:
         text: The string to add colorized output to
-        pattern: The regex pattern for the area you want to bolden
+        pattern: The compiled regex pattern for the area you want to bolden
 
     Returns:
         A string containing the ANSI escape codes
     """
-    return re.sub(pattern, lambda m: f"{colors.BOLD}{m.group()}{colors.CLEAR}", text)
+    return pattern.sub(_bold_match, text)
+
+
+def _feature_table(feature: Feature) -> tuple[list | None, list | None]:
+    """Splits a feature table into its header and the rows that match it"""
+    if not feature.table:
+        return None, None
+    table_headers, *rows = feature.table
+    row_length = len(table_headers)
+    return table_headers, [row for row in rows if len(row) == row_length]
+
+
+def _format_feature_delimited(
+    feature: Feature, only_table: bool, separator: str, replacement_char: str
+) -> str:
+    """Formats a feature as a single csv/tsv row"""
+    description = (
+        feature.description.replace(separator, replacement_char)
+        .replace("\n", "")
+        .strip()
+    )
+    return f"{feature.title}{separator}{description}"
+
+
+def _format_feature_json(feature: Feature, only_table: bool) -> str:
+    """Formats a feature as a JSON object"""
+    table_headers, table = _feature_table(feature)
+    formatted_feature = {
+        "feature_name": feature.title,
+        "feature_description": feature.description,
+    }
+    if table:
+        table = [dict(zip(table_headers, row)) for row in table]
+        formatted_feature.update({"feature_table": table})
+    return format_json(formatted_feature)
+
+
+def _format_feature_txt(feature: Feature, only_table: bool) -> str:
+    """Formats a feature for the terminal"""
+    table_headers, table = _feature_table(feature)
+    description = feature.description
+    title = _bold_title(feature.title) if feature.title else ""
+
+    if title is None:
+        title = re.match(".*:", description).group()
+
+    description = colorize(description, _HIGHLIGHT_RE)
+
+    formatted_table = format_table(table, headers=table_headers) if table else ""
+    formatted_feature = f"{title}\n{description}"
+    if table:
+        formatted_feature = f"{formatted_feature.strip()}\n{formatted_table}\n\n"
+
+    if only_table:
+        formatted_feature = formatted_table
+
+    return formatted_feature
+
+
+_FEATURE_FORMATTERS = {
+    "csv": partial(_format_feature_delimited, separator=",", replacement_char="|"),
+    "tsv": partial(_format_feature_delimited, separator="\t", replacement_char=""),
+    "json": _format_feature_json,
+}
 
 
 def format_feature(
@@ -359,65 +495,55 @@ def format_feature(
     Returns:
         Formatted output using the output_format form
     """
-    table = None
-    if feature.table:
-        table_headers, *table = [
-            row for row in feature.table if len(row) == len(feature.table[0])
-        ]
-
-    if output_format == "csv" or output_format == "tsv":
-        separator = "," if output_format == "csv" else "\t"
-        replacement_char = "|" if output_format == "csv" else ""
-        description = (
-            feature.description.replace(separator, replacement_char)
-            .replace("\n", "")
-            .strip()
-        )
-        formatted_feature = f"{feature.title}{separator}{description}"
-
-    elif output_format == "json":
-        formatted_feature = {
-            "feature_name": feature.title,
-            "feature_description": feature.description,
-        }
-        if table:
-            table = [dict(zip(table_headers, row)) for row in table]
-            formatted_feature.update({"feature_table": table})
-        formatted_feature = format_json(formatted_feature)
-
-    else:
-        highlights = [
-            "(Hit|Armor|Weapons|Tools|Saving|Skills)(.*):",
-            "Spell save DC",
-            "Spell attack modifier",
-            "Copying a Spell into the Book.",
-            "Replacing the Book.",
-            "The Book's Appearance.",
-        ]
-        description = feature.description
-        title = (
-            f"{colors.BOLD}{feature.title}{colors.CLEAR}\n{'─' * 40}"
-            if feature.title
-            else ""
-        )
+    return _FEATURE_FORMATTERS.get(output_format, _format_feature_txt)(
+        feature, only_table
+    )
 
-        if title is None:
-            title = re.match(".*:", description).group()
 
-        for h in highlights:
-            description = colorize(description, h)
+def _format_features_delimited(data: Subclass | DnDClass, output_format: str) -> str:
+    """Formats every feature of a class or subclass as csv/tsv rows"""
+    return "\n".join(
+        format_feature(feature, output_format) for feature in data.features
+    )
 
-        formatted_table = format_table(table, headers=table_headers) if table else ""
-        formatted_feature = f"{title}\n{description}"
-        if table:
-            formatted_feature = f"{formatted_feature.strip()}\n{formatted_table}\n\n"
 
-        if only_table:
-            formatted_feature = formatted_table
+def _format_subclass_json(data: Subclass, output_format: str) -> str:
+    """Formats a subclass as a JSON object"""
+    return format_json(
+        {
+            "class_name": data.class_name,
+            "subclass_name": data.title,
+            "subclass_description": data.description,
+            "subclass_source": data.source,
+            "features": [format_feature(feature, "json") for feature in data.features],
+        }
+    )
 
-        formatted_feature = textwrap.dedent(formatted_feature)
 
-    return formatted_feature
+def _format_subclass_txt(data: Subclass, output_format: str) -> str:
+    """Formats a subclass for the terminal"""
+    TERM_WIDTH, TERM_RULE = _terminal_rule()
+    padding = int((TERM_WIDTH - len(data.title)) / 2)
+    return textwrap.dedent(
+        f"""\
+        {TERM_RULE}
+        {" " * padding}{colors.BOLD}{data.class_name}:{data.title}{colors.CLEAR}
+        {TERM_RULE}
+        {colors.BOLD}Description
+        {_HR40}{colors.CLEAR}
+        {data.description}\n\n
+        {colors.BOLD}Source
+        {_HR40}{colors.CLEAR}
+        {data.source}\n\n
+        """
+    ) + "\n".join(format_feature(feature) for feature in data.features)
+
+
+_SUBCLASS_FORMATTERS = {
+    "csv": _format_features_delimited,
+    "tsv": _format_features_delimited,
+    "json": _format_subclass_json,
+}
 
 
 def format_subclass(data: Subclass, output_format: str = "str") -> str:
@@ -431,45 +557,58 @@ def format_subclass(data: Subclass, output_format: str = "str") -> str:
     Returns:
         A string containing the data in the desired output format.
     """
-    output = None
+    return _SUBCLASS_FORMATTERS.get(output_format, _format_subclass_txt)(
+        data, output_format
+    )
 
-    if output_format == "csv" or output_format == "tsv":
-        output = "\n".join(
-            [format_feature(feature, output_format) for feature in data.features]
-        )
 
-    elif output_format == "json":
-        output = format_json(
-            {
-                "class_name": data.class_name,
-                "subclass_name": data.title,
-                "subclass_description": data.description,
-                "subclass_source": data.source,
-                "features": [
-                    format_feature(feature, "json") for feature in data.features
-                ],
-            }
-        )
+def _format_class_json(data: DnDClass, output_format: str) -> str:
+    """Formats a class as a JSON object"""
+    return format_json(
+        {
+            "name": data.class_name,
+            "description": data.description,
+            "multiclass_requirement": data.multiclass_requirement,
+            "leveling_table": [
+                dict(zip(data.leveling_headers, row)) for row in data.leveling_table
+            ],
+            "features": [format_feature(feature, "json") for feature in data.features],
+        }
+    )
 
-    else:
-        TERM_WIDTH, _ = get_terminal_size()
-        padding = int((TERM_WIDTH - len(data.title)) / 2)
-        double_space = "\n\n"
-        output = textwrap.dedent(
-            f"""\
-            {"─" * TERM_WIDTH}
-            {" " * padding}{colors.BOLD}{data.class_name}:{data.title}{colors.CLEAR}
-            {"─" * TERM_WIDTH}
-            {colors.BOLD}Description
-            {"─" * 40}{colors.CLEAR}
-            {data.description}\n\n
-            {colors.BOLD}Source
-            {"─" * 40}{colors.CLEAR}
-            {data.source}\n\n
-            """
-        ) + "\n".join([format_feature(feature) for feature in data.features])
 
-    return output
+def _format_class_txt(data: DnDClass, output_format: str) -> str:
+    """Formats a class for the terminal"""
+    TERM_WIDTH, TERM_RULE = _terminal_rule()
+    padding = int((TERM_WIDTH - len(data.class_name)) / 2)
+    return (
+        textwrap.dedent(f"""\
+        {TERM_RULE}
+        {" " * padding}{colors.BOLD}{data.class_name}{colors.CLEAR}
+        {TERM_RULE}
+        {colors.BOLD}Description
+        {_HR40}{colors.CLEAR}
+        {data.description}
+
+
+        {colors.BOLD}Multiclass Requirement
+        {_HR40}{colors.CLEAR}
+        {data.multiclass_requirement}
+
+        {colors.BOLD}Leveling Table
+        {_HR40}{colors.CLEAR}
+        """)
+        + format_table(data.leveling_table, headers=data.leveling_headers)
+        + "\n\n"
+        + "\n".join(format_feature(feature) for feature in data.features)
+    )
+
+
+_CLASS_FORMATTERS = {
+    "csv": _format_features_delimited,
+    "tsv": _format_features_delimited,
+    "json": _format_class_json,
+}
 
 
 def format_class(data: DnDClass, output_format: str = "str") -> str:
@@ -483,50 +622,4 @@ def format_class(data: DnDClass, output_format: str = "str") -> str:
     Returns:
         A string containing the data in the desired output format.
     """
-    output = None
-    if output_format == "csv" or output_format == "tsv":
-        output = "\n".join(
-            [format_feature(feature, output_format) for feature in data.features]
-        )
-
-    elif output_format == "json":
-        output = format_json(
-            {
-                "name": data.class_name,
-                "description": data.description,
-                "multiclass_requirement": data.multiclass_requirement,
-                "leveling_table": [
-                    dict(zip(data.leveling_headers, row)) for row in data.leveling_table
-                ],
-                "features": [
-                    format_feature(feature, "json") for feature in data.features
-                ],
-            }
-        )
-
-    else:
-        TERM_WIDTH, _ = get_terminal_size()
-        padding = int((TERM_WIDTH - len(data.class_name)) / 2)
-        output = (
-            textwrap.dedent(f"""\
-            {"─" * TERM_WIDTH}
-            {" " * padding}{colors.BOLD}{data.class_name}{colors.CLEAR}
-            {"─" * TERM_WIDTH}
-            {colors.BOLD}Description
-            {"─" * 40}{colors.CLEAR}
-            {data.description}
-
-
-            {colors.BOLD}Multiclass Requirement
-            {"─" * 40}{colors.CLEAR}
-            {data.multiclass_requirement}
-
-            {colors.BOLD}Leveling Table
-            {"─" * 40}{colors.CLEAR}
-            """)
-            + format_table(data.leveling_table, headers=data.leveling_headers)
-            + "\n\n"
-            + "\n".join([format_feature(feature) for feature in data.features])
-        )
-
-    return output
+    return _CLASS_FORMATTERS.get(output_format, _format_class_txt)(data, output_format)
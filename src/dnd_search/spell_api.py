@@ -1,13 +1,29 @@
 #!/usr/bin/env python3
+import concurrent.futures
 import logging
 import re
 
-from bs4 import BeautifulSoup
+import requests
+from lxml import html as lxml_html
 
 import dnd_search.api as api
 from dnd_search.dnd_data import Spell
 from dnd_search.format_output import format_error
 
+_SLUG_TABLE = str.maketrans(" /", "--")
+_ELLIPSIS = "..."
+
+# "3rd-level evocation" at the start of the paragraph, or "Evocation cantrip"
+# on its last line, told apart by the last group
+_RE_SPELL_LEVEL = re.compile(
+    "^(?P<level>[0-9].*level) (?P<school>.*)|(?P<cantrip_school>.*) (?P<cantrip>cantrip)$"
+)
+_RE_FEET = re.compile("[ -]+f[eo]+t")
+
+# Filled through api.remember, so only found spells are kept
+_SPELLS: dict[str, Spell] = {}
+_SPELL_LISTS: dict[tuple[str, bool], list[Spell]] = {}
+
 
 def get_spell(spell_name: str) -> Spell:
     """
@@ -20,57 +36,69 @@ def get_spell(spell_name: str) -> Spell:
     Returns:
         Spell object containing all specified information
     """
-    uri = f"{api.WIKIDOT_URI}/spell:{spell_name.replace(' ', '-').replace('/', '-').lower()}"
+    if (spell := _SPELLS.get(spell_name)) is not None:
+        return spell
+
+    uri = f"{api.WIKIDOT_URI}/spell:{spell_name.translate(_SLUG_TABLE).lower()}"
     try:
         content = api.api_call(uri)
 
-    except AssertionError:
+    except requests.HTTPError:
         output = format_error("spell", spell_name.title())
         logging.error(output)
         return None
 
-    soup = BeautifulSoup(content, "html.parser")
-    name = soup.find(class_="page-title").text
+    except requests.RequestException as e:
+        logging.error(f"Unable to reach {uri}: {e}")
+        return None
+
+    tree = _parse_html(content)
+    name = "".join(title.text_content() for title in tree.find_class("page-title"))
+    page_content = tree.xpath('//*[@id="page-content"]//*[self::p or self::ul]')
     (
         source,
         level,
         school,
         casting_time,
         spell_range,
+        duration,
         components,
-        effect,
         higher_level_effect,
     ) = [""] * 8
     classes = []
+    effect = []
+
+    for d in page_content:
+        text = d.text_content()
+        if not text.isascii():
+            text = text.replace("\u2019", "'")
+        text += "\n"
+
+        if d.tag == "ul":
+            effect.append(f"\t* {text.strip()}\n")
+
+        elif text.startswith("Source"):
+            source = text.partition("Source: ")[2].partition("\n")[0]
+
+        elif text[:1].isdigit() or text.endswith("cantrip\n"):
+            match = _RE_SPELL_LEVEL.search(text)
+            if match is None:
+                effect.append(f"{text}\n")
+            elif match.lastgroup == "cantrip":
+                school, level = match.group("cantrip_school", "cantrip")
+            else:
+                level, school = match.group("level", "school")
 
-    for d in soup.find(id="page-content").find_all(["p", "ul"]):
-        text = d.text + "\n"
-        text = text.replace("\u2019", "'")
-
-        if re.match("Source", text):
-            source = re.search("(?<=Source: ).*", text).group()
-
-        elif re.match("[0-9]", text):
-            level, school = re.search("(^[0-9].*level) (.*)", text).groups()
-
-        elif re.search("cantrip$", text):
-            school, level = re.search("(.*) (cantrip)$", text).groups()
-
-        elif re.match("Spell Lists", text):
+        elif text.startswith("Spell Lists"):
             text = text[text.index(".") + 1 :]
             classes = [c.strip() for c in text.split(",")]
 
         elif "Casting Time: " in text:
-            pattern = re.compile(
-                "(?<=Casting Time: ).*|"
-                "(?<=Range: ).*|"
-                "(?<=Components: ).*|"
-                "(?<=Duration: ).*"
-            )
-            casting_time, spell_range, components, duration = re.findall(pattern, text)
-
-        elif d.name == "ul":
-            effect = f"{effect}\t* {text.strip()}\n"
+            timing = dict(line.partition(": ")[::2] for line in text.splitlines())
+            casting_time = timing.get("Casting Time", casting_time)
+            spell_range = timing.get("Range", spell_range)
+            components = timing.get("Components", components)
+            duration = timing.get("Duration", duration)
 
         else:
             if "At Higher Levels." in text:
@@ -78,9 +106,9 @@ def get_spell(spell_name: str) -> Spell:
                 higher_level_effect = f"{text}\n"
 
             else:
-                effect = f"{effect}{text}\n"
+                effect.append(f"{text}\n")
 
-    return Spell(
+    spell = Spell(
         name,
         source,
         level.capitalize(),
@@ -89,10 +117,41 @@ def get_spell(spell_name: str) -> Spell:
         spell_range,
         duration,
         components,
-        effect,
+        "".join(effect),
         higher_level_effect,
         classes,
     )
+    return api.remember(_SPELLS, spell_name, spell, maxsize=512)
+
+
+def get_spells_bulk(spell_names: list[str]) -> list[Spell]:
+    """
+    Fetches several spells concurrently. Each page is a separate request,
+    so they are issued from a thread pool sized to the shared session's
+    connection pool.
+
+    Args:
+        spell_names: Names of DnD 5e spells
+
+    Returns:
+        Spell objects in the same order as spell_names, with None for any
+        spell that could not be found
+    """
+    # Names that differ only in case or separators share a page, so each page
+    # is requested once and its result is handed back to every matching name
+    slugs = [spell_name.translate(_SLUG_TABLE).lower() for spell_name in spell_names]
+    unique = {}
+    for slug, spell_name in zip(slugs, spell_names):
+        unique.setdefault(slug, spell_name)
+
+    if len(unique) <= 1:
+        spells = {slug: get_spell(spell_name) for slug, spell_name in unique.items()}
+    else:
+        workers = min(api.MAX_WORKERS, len(unique))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            spells = dict(zip(unique, executor.map(get_spell, unique.values())))
+
+    return [spells[slug] for slug in slugs]
 
 
 def get_spell_list(class_name: str, trim_output: bool = False) -> list[Spell]:
@@ -108,68 +167,106 @@ def get_spell_list(class_name: str, trim_output: bool = False) -> list[Spell]:
         A list containing abbreviated spell information.
                           Does not include spell effect.
     """
+    cache_key = (class_name, trim_output)
+    if (spell_list := _SPELL_LISTS.get(cache_key)) is not None:
+        return spell_list
+
     class_name = f":{class_name.lower()}" if class_name else ""
     uri = f"{api.WIKIDOT_URI}/spells{class_name}"
 
     try:
         content = api.api_call(uri)
 
-    except AssertionError:
+    except requests.HTTPError:
         output = format_error("class", class_name.title())
         logging.error(output)
         return None
 
-    soup = BeautifulSoup(content, "html.parser")
-    spells = soup.find_all("tr")
+    except requests.RequestException as e:
+        logging.error(f"Unable to reach {uri}: {e}")
+        return None
 
-    level = -1
-    spell_list = []
-    for spell in spells:
-        tags = [tag.name for tag in spell]
+    # The spell tables are read straight from the lxml tree, so each cell's
+    # text comes from libxml2 without building a BeautifulSoup tree
+    rows = _parse_html(content).xpath("//tr")
 
-        if "th" in tags:
+    level = level_name = -1
+    spell_list = []
+    for row in rows:
+        if row.find("th") is not None:
             level += 1
+            level_name = "Cantrip" if level == 0 else level
             continue
 
-        name, school, casting_time, spell_range, duration, components = (
-            spell.text.split("\n")[1:-1]
-        )
+        cells = [td.text_content() for td in row.xpath("./td")]
+        spell_list.append(_spell_from_row(cells, level_name, trim_output))
 
-        if trim_output:
-            name = truncate_string(name, 15)
-            school = school[:3]
-            casting_time = re.sub("R$", "(Rit)", casting_time)
-            casting_time = re.sub("Bonus", "B", casting_time)
-            casting_time = re.sub("Minute", "Min", casting_time)
-            duration = truncate_string(duration, 10)
+    return api.remember(_SPELL_LISTS, cache_key, spell_list, maxsize=32)
 
-        else:
-            if "R" in casting_time:
-                casting_time = re.sub("R$", "(Ritual)", casting_time)
 
-            if re.search("[CDGT]+$", school):
-                school = re.sub("[CDGT]+$", "", school)
+def _spell_from_row(
+    cells: list[str], level_name: str | int, trim_output: bool
+) -> Spell:
+    """
+    Builds the abbreviated spell for one row of a spell list table.
+
+    Args:
+        cells: Text of the row's name, school, casting time, range, duration and components cells
+        level_name: Spell level of the table the row belongs to
+        trim_output: Whether to shorten the values for narrow output
+
+    Returns:
+        Spell object without source, effect or class information
+    """
+    name, school, casting_time, spell_range, duration, components = cells
+
+    if trim_output:
+        name = truncate_string(name, 15)
+        school = school[:3]
+        if casting_time.endswith("R"):
+            casting_time = f"{casting_time[:-1]}(Rit)"
+        casting_time = casting_time.replace("Bonus", "B").replace("Minute", "Min")
+        duration = truncate_string(duration, 10)
+
+    else:
+        if casting_time.endswith("R"):
+            casting_time = f"{casting_time[:-1]}(Ritual)"
+
+        # Drop the trailing source markers, e.g. "Divination D"
+        school = school.rstrip("CDGT")
+
+    # Most ranges (Self, Touch, Sight) have no distance in feet to shorten
+    if " f" in spell_range or "-f" in spell_range:
+        spell_range = _RE_FEET.sub(" ft", spell_range)
+
+    return Spell(
+        name,
+        None,
+        level_name,
+        school,
+        casting_time,
+        spell_range,
+        duration,
+        components,
+        None,
+        None,
+        None,
+    )
 
-        spell_range = re.sub("[ -]+f[eo]+t", " ft", spell_range)
-        level_name = "Cantrip" if level == 0 else level
 
-        s = Spell(
-            name,
-            None,
-            level_name,
-            school,
-            casting_time,
-            spell_range,
-            duration,
-            components,
-            None,
-            None,
-            None,
-        )
+def _parse_html(content: bytes) -> lxml_html.HtmlElement:
+    """
+    Parses a wikidot page with lxml. Pages are always served as UTF-8, so the
+    encoding is set rather than guessed. A parser is built per call because
+    lxml parsers can't be shared between the get_spells_bulk threads.
 
-        spell_list.append(s)
+    Args:
+        content: HTML content of the page
 
-    return spell_list
+    Returns:
+        Root element of the parsed page
+    """
+    return lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding="utf-8"))
 
 
 def truncate_string(input_str: str, max_length: int = 10) -> str:
@@ -185,9 +282,7 @@ def truncate_string(input_str: str, max_length: int = 10) -> str:
     Returns:
         str: updated string
     """
-    str_end = "..."
-
     if len(input_str) > max_length:
-        return input_str[: max_length - len(str_end)] + str_end
+        return input_str[: max_length - len(_ELLIPSIS)] + _ELLIPSIS
 
     return input_str